@@ -100,6 +100,23 @@ def _sequence_input_check(func: Callable) -> Callable[[Sequence], bool]:
 
 
 def _check_all_arguments(checks: list[Callable]) -> Callable[..., bool]:
+    # rules take one or two arguments in most cases, which can be checked directly
+    if len(checks) == 1:
+        (check,) = checks
+
+        def check_one(*args: Any) -> bool:
+            return check(args[0])
+
+        return check_one
+
+    if len(checks) == 2:
+        check1, check2 = checks
+
+        def check_two(*args: Any) -> bool:
+            return check1(args[0]) and check2(args[1])
+
+        return check_two
+
     def wrapper(*args: Any) -> bool:
         return all(check(arg) for check, arg in zip(checks, args))
 
@@ -115,6 +132,13 @@ class _ValueExtractor(Generic[_ElementType]):
             self.__obj_type = obj_type.__args__[0]  # type: ignore[union-attr]
             self.__function = self.__optional_extract  # type: ignore[assignment]
 
+        self.__converter: Callable[[Any], Any] = self.__obj_type
+        if (
+            "__supertype__" in self.__obj_type.__dict__
+            and self.__obj_type.__supertype__ == Parity  # type: ignore[attr-defined]
+        ):
+            self.__converter = self.__obj_type.__supertype__  # type: ignore[attr-defined]
+
     def __call__(
         self, props: GraphElementPropertyMap[_ElementType]
     ) -> _ElementType | None:
@@ -134,12 +158,7 @@ class _ValueExtractor(Generic[_ElementType]):
         value = props[self.__obj_type]
         if value is None:
             return None
-        if (
-            "__supertype__" in self.__obj_type.__dict__
-            and self.__obj_type.__supertype__ == Parity  # type: ignore[attr-defined]
-        ):
-            return self.__obj_type.__supertype__(value)  # type: ignore[attr-defined]
-        return self.__obj_type(value)  # type: ignore[call-arg]
+        return self.__converter(value)
 
 
 class _CompositeArgumentCreator:
@@ -176,6 +195,17 @@ def _sequence_arg_builder(func: Callable) -> Callable[[Sequence], list[Any]]:
 
 
 def _build_all_arguments(checks: list[Callable]) -> Callable:
+    if len(checks) == 1:
+        (build,) = checks
+
+        def build_one(*args: Any) -> list[Any]:
+            arg = args[0]
+            if arg:
+                return [build(arg)]
+            return []
+
+        return build_one
+
     def wrapper(*args: Any) -> list[Any]:
         return [check(arg) for check, arg in zip(checks, args) if arg]
 
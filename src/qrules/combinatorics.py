@@ -165,8 +165,27 @@ def _get_kinematic_representation(
     length and element content) for comparisons.
     """
 
-    def get_state_groupings(get_edge: Callable[[int], set[int]]) -> list[list[int]]:
-        return [sorted(get_edge(i)) for i in topology.nodes]
+    def get_state_groupings(
+        get_edge_ids: Callable[[int], set[int]],
+        external_edge_ids: frozenset[int],
+        get_next_node_id: Callable[[int], int | None],
+    ) -> list[list[int]]:
+        # each node is visited once, reusing the edge IDs of the nodes it leads to
+        edge_ids_per_node: dict[int, set[int]] = {}
+
+        def collect_edge_ids(node_id: int) -> set[int]:
+            if node_id not in edge_ids_per_node:
+                edge_ids = set()
+                for edge_id in get_edge_ids(node_id):
+                    next_node_id = get_next_node_id(edge_id)
+                    if edge_id in external_edge_ids:
+                        edge_ids.add(edge_id)
+                    elif next_node_id is not None:
+                        edge_ids |= collect_edge_ids(next_node_id)
+                edge_ids_per_node[node_id] = edge_ids
+            return edge_ids_per_node[node_id]
+
+        return [sorted(collect_edge_ids(i)) for i in topology.nodes]
 
     def fill_groupings(
         edge_id_groupings: Iterable[Iterable[int]],
@@ -177,10 +196,18 @@ def _get_kinematic_representation(
         ]
 
     initial_state_edge_groups = fill_groupings(
-        get_state_groupings(topology.get_originating_initial_state_edge_ids)
+        get_state_groupings(
+            topology.get_edge_ids_ingoing_to_node,
+            topology.incoming_edge_ids,
+            lambda i: topology.edges[i].originating_node_id,
+        )
     )
     final_state_edge_groups = fill_groupings(
-        get_state_groupings(topology.get_originating_final_state_edge_ids)
+        get_state_groupings(
+            topology.get_edge_ids_outgoing_from_node,
+            topology.outgoing_edge_ids,
+            lambda i: topology.edges[i].ending_node_id,
+        )
     )
     return _KinematicRepresentation(
         initial_state=initial_state_edge_groups,
@@ -46,17 +46,30 @@ has been defined to provide type checks on `.parity_conservation_helicity`.
 """
 
 import sys
-from copy import deepcopy
-from functools import reduce
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from textwrap import dedent
-from typing import Any, Callable, List, Optional, Set, Tuple, Type, Union
-
-from attrs import define, field, frozen
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from attrs import field, frozen
 from attrs.converters import optional
 
 from qrules.quantum_numbers import EdgeQuantumNumbers as EdgeQN
 from qrules.quantum_numbers import NodeQuantumNumbers as NodeQN
-from qrules.quantum_numbers import arange
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -65,7 +78,12 @@ else:
 
 
 def _is_boson(spin_magnitude: float) -> bool:
-    return abs(spin_magnitude % 1) < 0.01
+    return spin_magnitude % 1 == 0
+
+
+def _sign(exponent: float) -> int:
+    """Compute :math:`(-1)^k` for an integral exponent :math:`k`."""
+    return 1 - ((int(exponent) & 1) << 1)
 
 
 def _is_particle_antiparticle_pair(pid1: int, pid2: int) -> bool:
@@ -74,6 +92,9 @@ def _is_particle_antiparticle_pair(pid1: int, pid2: int) -> bool:
     return pid1 == -pid2
 
 
+_get_spin_magnitude = attrgetter("spin_magnitude")
+
+
 class GraphElementRule(Protocol):
     def __call__(self, __qns: Any) -> bool: ...
 
@@ -178,12 +199,16 @@ def parity_conservation(
     l_magnitude: NodeQN.l_magnitude,
 ) -> bool:
     r"""Implement :math:`P_{in} = P_{out} \cdot (-1)^L`."""
-    if any(p is None for p in [*ingoing_edge_qns, *outgoing_edge_qns]):
+    if any(p is None for p in chain(ingoing_edge_qns, outgoing_edge_qns)):
         return False
     if len(ingoing_edge_qns) == 1 and len(outgoing_edge_qns) == 2:
-        parity_in = reduce(lambda x, y: x * y.value, ingoing_edge_qns, 1)
-        parity_out = reduce(lambda x, y: x * y.value, outgoing_edge_qns, 1)
-        return parity_in == (parity_out * (-1) ** l_magnitude)
+        parity_in = 1
+        for parity in ingoing_edge_qns:
+            parity_in *= parity.value
+        parity_out = 1
+        for parity in outgoing_edge_qns:
+            parity_out *= parity.value
+        return parity_in == (parity_out * _sign(l_magnitude))
     return True
 
 
@@ -213,15 +238,16 @@ def parity_conservation_helicity(
     """
     if len(ingoing_edge_qns) == 1 and len(outgoing_edge_qns) == 2:
         out_spins = [x.spin_magnitude for x in outgoing_edge_qns]
-        parity_product = reduce(
-            lambda x, y: x * y.parity.value if y.parity else x,
-            ingoing_edge_qns + outgoing_edge_qns,
-            1,
-        )
+        exponent = sum(out_spins) - ingoing_edge_qns[0].spin_magnitude
+        if exponent % 1 != 0:
+            # (-1)^exponent is imaginary and cannot match a parity prefactor
+            return False
+        parity_product = 1
+        for edge_qns in ingoing_edge_qns + outgoing_edge_qns:
+            if edge_qns.parity:
+                parity_product *= edge_qns.parity.value
 
-        prefactor = parity_product * (-1.0) ** (
-            sum(out_spins) - ingoing_edge_qns[0].spin_magnitude
-        )
+        prefactor = parity_product * _sign(exponent)
 
         if all(x.spin_projection == 0.0 for x in outgoing_edge_qns) and prefactor == -1:
             return False
@@ -256,10 +282,14 @@ def c_parity_conservation(
     def _get_c_parity_multiparticle(
         part_qns: List[CParityEdgeInput], interaction_qns: CParityNodeInput
     ) -> Optional[int]:
-        c_parities_part = [x.c_parity.value for x in part_qns if x.c_parity]
         # if all states have C parity defined, then just multiply them
-        if len(c_parities_part) == len(part_qns):
-            return reduce(lambda x, y: x * y, c_parities_part, 1)
+        c_parity = 1
+        for edge_qns in part_qns:
+            if not edge_qns.c_parity:
+                break
+            c_parity *= edge_qns.c_parity.value
+        else:
+            return c_parity
 
         # two particle case
         if len(part_qns) == 2:  # noqa: SIM102
@@ -267,10 +297,10 @@ def c_parity_conservation(
                 ang_mom = interaction_qns.l_magnitude
                 # if boson
                 if _is_boson(part_qns[0].spin_magnitude):
-                    return (-1) ** int(ang_mom)
+                    return _sign(ang_mom)
                 coupled_spin = interaction_qns.s_magnitude
                 if isinstance(coupled_spin, int) or coupled_spin.is_integer():
-                    return (-1) ** int(ang_mom + coupled_spin)
+                    return _sign(ang_mom + coupled_spin)
         return None
 
     c_parity_in = _get_c_parity_multiparticle(ingoing_edge_qns, interaction_node_qns)
@@ -321,10 +351,10 @@ def g_parity_conservation(  # noqa: C901
             if isinstance(isospin, int) or isospin.is_integer():
                 # if boson
                 if _is_boson(double_state_qns[0].spin_magnitude):
-                    return (-1) ** int(ang_mom + isospin)
+                    return _sign(ang_mom + isospin)
                 coupled_spin = interaction_qns.s_magnitude
                 if isinstance(coupled_spin, int) or coupled_spin.is_integer():
-                    return (-1) ** int(ang_mom + coupled_spin + isospin)
+                    return _sign(ang_mom + coupled_spin + isospin)
         return None
 
     def check_g_parity_isobar(
@@ -343,20 +373,16 @@ def g_parity_conservation(  # noqa: C901
             return True
         return couple_state_g_parity == single_state_g_parity
 
-    no_g_parity_in_part = [True for x in ingoing_edge_qns if x.g_parity is None]
-    no_g_parity_out_part = [True for x in outgoing_edge_qns if x.g_parity is None]
     # if all states have G parity defined, then just multiply them
-    if not any(no_g_parity_in_part + no_g_parity_out_part):
-        in_g_parity = reduce(
-            lambda x, y: x * y.g_parity.value if y.g_parity else x,
-            ingoing_edge_qns,
-            1,
-        )
-        out_g_parity = reduce(
-            lambda x, y: x * y.g_parity.value if y.g_parity else x,
-            outgoing_edge_qns,
-            1,
-        )
+    if not any(x.g_parity is None for x in chain(ingoing_edge_qns, outgoing_edge_qns)):
+        in_g_parity = 1
+        for edge_qns in ingoing_edge_qns:
+            if edge_qns.g_parity:
+                in_g_parity *= edge_qns.g_parity.value
+        out_g_parity = 1
+        for edge_qns in outgoing_edge_qns:
+            if edge_qns.g_parity:
+                out_g_parity *= edge_qns.g_parity.value
         return in_g_parity == out_g_parity
 
     # two particle case
@@ -431,12 +457,25 @@ def identical_particle_symmetrization(
     return True
 
 
-@frozen
+@frozen(cache_hash=True)
 class _Spin:
     magnitude: float
     projection: float
 
 
+_SPIN_INSTANCES: Dict[Tuple[float, float], _Spin] = {}
+
+
+def _make_spin(magnitude: float, projection: float) -> _Spin:
+    """Get a shared `_Spin` instance for a magnitude and projection."""
+    key = (magnitude, projection)
+    spin = _SPIN_INSTANCES.get(key)
+    if spin is None:
+        spin = _Spin(magnitude, projection)
+        _SPIN_INSTANCES[key] = spin
+    return spin
+
+
 def _is_clebsch_gordan_coefficient_zero(
     spin1: _Spin, spin2: _Spin, spin_coupled: _Spin
 ) -> bool:
@@ -472,10 +511,8 @@ class SpinMagnitudeNodeInput:
 def ls_spin_validity(spin_input: SpinNodeInput) -> bool:
     r"""Check for valid isospin magnitude and projection."""
     return _check_spin_valid(
-        float(spin_input.l_magnitude), float(spin_input.l_projection)
-    ) and _check_spin_valid(
-        float(spin_input.s_magnitude), float(spin_input.s_projection)
-    )
+        spin_input.l_magnitude, spin_input.l_projection
+    ) and _check_spin_valid(spin_input.s_magnitude, spin_input.s_projection)
 
 
 def _check_magnitude(
@@ -483,11 +520,6 @@ def _check_magnitude(
     out_part: List[float],
     interaction_qns: Optional[Union[SpinMagnitudeNodeInput, SpinNodeInput]],
 ) -> bool:
-    def couple_mags(j_1: float, j_2: float) -> List[float]:
-        return [
-            x / 2.0 for x in range(int(2 * abs(j_1 - j_2)), int(2 * (j_1 + j_2 + 1)), 2)
-        ]
-
     def couple_magnitudes(
         magnitudes: List[float],
         interaction_qns: Optional[Union[SpinMagnitudeNodeInput, SpinNodeInput]],
@@ -495,17 +527,24 @@ def _check_magnitude(
         if len(magnitudes) == 1:
             return set(magnitudes)
 
+        if interaction_qns:
+            # the coupled magnitude is bound by the magnitudes that are coupled
+            max_magnitude = sum(magnitudes)
+            min_magnitude = max(0, 2 * max(magnitudes) - max_magnitude)
+            if not min_magnitude <= interaction_qns.s_magnitude <= max_magnitude:
+                return set()
+
         coupled_magnitudes = {magnitudes[0]}
         for mag in magnitudes[1:]:
             temp_set = coupled_magnitudes
             coupled_magnitudes = set()
             for ref_mag in temp_set:
-                coupled_magnitudes.update(couple_mags(mag, ref_mag))
+                coupled_magnitudes.update(_couple_mags(mag, ref_mag))
 
         if interaction_qns:
             if interaction_qns.s_magnitude in coupled_magnitudes:
                 return set(
-                    couple_mags(
+                    _couple_mags(
                         interaction_qns.s_magnitude,
                         interaction_qns.l_magnitude,
                     )
@@ -520,11 +559,22 @@ def _check_magnitude(
     return len(matching_spins) > 0
 
 
+@lru_cache(maxsize=None)
+def _couple_mags(j_1: float, j_2: float) -> Tuple[float, ...]:
+    return tuple(
+        x / 2.0 for x in range(int(2 * abs(j_1 - j_2)), int(2 * (j_1 + j_2 + 1)), 2)
+    )
+
+
 def _check_spin_couplings(
     in_part: List[_Spin],
     out_part: List[_Spin],
     interaction_qns: Optional[SpinNodeInput],
 ) -> bool:
+    if len(in_part) == 1:
+        return in_part[0] in __calculate_total_spins(out_part, interaction_qns)
+    if len(out_part) == 1:
+        return out_part[0] in __calculate_total_spins(in_part, interaction_qns)
     in_tot_spins = __calculate_total_spins(in_part, interaction_qns)
     out_tot_spins = __calculate_total_spins(out_part, interaction_qns)
     matching_spins = in_tot_spins & out_tot_spins
@@ -534,17 +584,19 @@ def _check_spin_couplings(
 def __calculate_total_spins(
     spins: List[_Spin],
     interaction_qns: Optional[SpinNodeInput] = None,
-) -> Set[_Spin]:
+) -> AbstractSet[_Spin]:
     total_spins = set()
     if len(spins) == 1:
         return set(spins)
     total_spins = __create_coupled_spins(spins)
     if interaction_qns:
-        coupled_spin = _Spin(interaction_qns.s_magnitude, interaction_qns.s_projection)
+        coupled_spin = _make_spin(
+            interaction_qns.s_magnitude, interaction_qns.s_projection
+        )
         if coupled_spin in total_spins:
             return __spin_couplings(
                 coupled_spin,
-                _Spin(interaction_qns.l_magnitude, interaction_qns.l_projection),
+                _make_spin(interaction_qns.l_magnitude, interaction_qns.l_projection),
             )
         total_spins = set()
 
@@ -553,23 +605,20 @@ def __calculate_total_spins(
 
 def __create_coupled_spins(spins: List[_Spin]) -> Set[_Spin]:
     """Creates all combinations of coupled spins."""
-    spins_daughters_coupled: Set[_Spin] = set()
-    spin_list = deepcopy(spins)
-    while spin_list:
-        if spins_daughters_coupled:
-            temp_coupled_spins = set()
-            tempspin = spin_list.pop()
-            for spin in spins_daughters_coupled:
-                coupled_spins = __spin_couplings(spin, tempspin)
-                temp_coupled_spins.update(coupled_spins)
-            spins_daughters_coupled = temp_coupled_spins
-        else:
-            spins_daughters_coupled.add(spin_list.pop())
-
+    if not spins:
+        return set()
+    spin_iter = reversed(spins)
+    spins_daughters_coupled = {next(spin_iter)}
+    for tempspin in spin_iter:
+        temp_coupled_spins: Set[_Spin] = set()
+        for spin in spins_daughters_coupled:
+            temp_coupled_spins.update(__spin_couplings(spin, tempspin))
+        spins_daughters_coupled = temp_coupled_spins
     return spins_daughters_coupled
 
 
-def __spin_couplings(spin1: _Spin, spin2: _Spin) -> Set[_Spin]:
+@lru_cache(maxsize=None)
+def __spin_couplings(spin1: _Spin, spin2: _Spin) -> FrozenSet[_Spin]:
     r"""Implement the coupling of two spins.
 
     :math:`|S_1 - S_2| \leq S \leq |S_1 + S_2|` and :math:`M_1 + M_2 = M`
@@ -578,15 +627,21 @@ def __spin_couplings(spin1: _Spin, spin2: _Spin) -> Set[_Spin]:
     s_2 = spin2.magnitude
 
     sum_proj = spin1.projection + spin2.projection
-    return {
-        _Spin(x, sum_proj)
-        for x in arange(abs(s_1 - s_2), s_1 + s_2 + 1, 1.0)
-        if x >= abs(sum_proj)
-        and not _is_clebsch_gordan_coefficient_zero(spin1, spin2, _Spin(x, sum_proj))
-    }
+    doubled_min = round(2 * abs(s_1 - s_2))
+    doubled_max = round(2 * (s_1 + s_2))
+    candidates = (
+        _make_spin(doubled_mag / 2, sum_proj)
+        for doubled_mag in range(doubled_min, doubled_max + 1, 2)
+        if doubled_mag / 2 >= abs(sum_proj)
+    )
+    return frozenset(
+        spin
+        for spin in candidates
+        if not _is_clebsch_gordan_coefficient_zero(spin1, spin2, spin)
+    )
 
 
-@define
+@frozen
 class IsoSpinEdgeInput:
     isospin_magnitude: EdgeQN.isospin_magnitude = field(
         converter=EdgeQN.isospin_magnitude
@@ -606,9 +661,23 @@ def _check_spin_valid(magnitude: float, projection: float) -> bool:
 
 def isospin_validity(isospin: IsoSpinEdgeInput) -> bool:
     r"""Check for valid isospin magnitude and projection."""
-    return _check_spin_valid(
-        float(isospin.isospin_magnitude), float(isospin.isospin_projection)
-    )
+    return _check_spin_valid(isospin.isospin_magnitude, isospin.isospin_projection)
+
+
+def _collect_isospins(
+    isospins: List[IsoSpinEdgeInput],
+) -> Optional[Tuple[float, List[_Spin]]]:
+    """Sum the isospin projections and create spins, or `None` if one is invalid."""
+    total_projection = 0.0
+    spins = []
+    for isospin in isospins:
+        magnitude = isospin.isospin_magnitude
+        projection = isospin.isospin_projection
+        if not _check_spin_valid(magnitude, projection):
+            return None
+        total_projection += projection
+        spins.append(_make_spin(magnitude, projection))
+    return total_projection, spins
 
 
 def isospin_conservation(
@@ -625,20 +694,24 @@ def isospin_conservation(
     Also checks :math:`I_{1,z} + I_{2,z} = I_z` and if Clebsch-Gordan coefficients are
     all 0.
     """
-    if sum(x.isospin_projection for x in ingoing_isospins) != sum(
-        x.isospin_projection for x in outgoing_isospins
-    ):
+    ingoing = _collect_isospins(ingoing_isospins)
+    if ingoing is None:
+        return False
+    outgoing = _collect_isospins(outgoing_isospins)
+    if outgoing is None:
         return False
-    if not all(isospin_validity(x) for x in ingoing_isospins + outgoing_isospins):
+    in_projection, in_spins = ingoing
+    out_projection, out_spins = outgoing
+    if in_projection != out_projection:
         return False
     return _check_spin_couplings(
-        [_Spin(x.isospin_magnitude, x.isospin_projection) for x in ingoing_isospins],
-        [_Spin(x.isospin_magnitude, x.isospin_projection) for x in outgoing_isospins],
+        in_spins,
+        out_spins,
         None,
     )
 
 
-@define
+@frozen
 class SpinEdgeInput:
     spin_magnitude: EdgeQN.spin_magnitude = field(converter=EdgeQN.spin_magnitude)
     spin_projection: EdgeQN.spin_projection = field(converter=EdgeQN.spin_projection)
@@ -646,7 +719,7 @@ class SpinEdgeInput:
 
 def spin_validity(spin: SpinEdgeInput) -> bool:
     r"""Check for valid spin magnitude and projection."""
-    return _check_spin_valid(float(spin.spin_magnitude), float(spin.spin_projection))
+    return _check_spin_valid(spin.spin_magnitude, spin.spin_projection)
 
 
 def spin_conservation(
@@ -677,17 +750,18 @@ def spin_conservation(
         len(ingoing_spins) == 2 and len(outgoing_spins) == 1
     ):
         return _check_spin_couplings(
-            [_Spin(x.spin_magnitude, x.spin_projection) for x in ingoing_spins],
-            [_Spin(x.spin_magnitude, x.spin_projection) for x in outgoing_spins],
+            [_make_spin(x.spin_magnitude, x.spin_projection) for x in ingoing_spins],
+            [_make_spin(x.spin_magnitude, x.spin_projection) for x in outgoing_spins],
             interaction_qns,
         )
 
     # otherwise don't use S and L and just check magnitude
-    # are integral or non integral on both sides
-    return (
-        sum(float(x.spin_magnitude) for x in ingoing_spins).is_integer()  # type: ignore[union-attr]
-        == sum(float(x.spin_magnitude) for x in outgoing_spins).is_integer()  # type: ignore[union-attr]
+    # are integral or non integral on both sides, which for
+    # half-integer spins means that their difference is integral
+    spin_difference = sum(map(_get_spin_magnitude, ingoing_spins)) - sum(
+        map(_get_spin_magnitude, outgoing_spins)
     )
+    return spin_difference % 1 == 0
 
 
 def spin_magnitude_conservation(
@@ -720,11 +794,12 @@ def spin_magnitude_conservation(
         )
 
     # otherwise don't use S and L and just check magnitude
-    # are integral or non integral on both sides
-    return (
-        sum(float(x.spin_magnitude) for x in ingoing_spins).is_integer()  # type: ignore[union-attr]
-        == sum(float(x.spin_magnitude) for x in outgoing_spins).is_integer()  # type: ignore[union-attr]
+    # are integral or non integral on both sides, which for
+    # half-integer spins means that their difference is integral
+    spin_difference = sum(map(_get_spin_magnitude, ingoing_spins)) - sum(
+        map(_get_spin_magnitude, outgoing_spins)
     )
+    return spin_difference % 1 == 0
 
 
 def clebsch_gordan_helicity_to_canonical(
@@ -742,11 +817,11 @@ def clebsch_gordan_helicity_to_canonical(
         `.spin_magnitude_conservation`.
     """
     if len(ingoing_spins) == 1 and len(outgoing_spins) == 2:
-        out_spin1 = _Spin(
+        out_spin1 = _make_spin(
             outgoing_spins[0].spin_magnitude,
             outgoing_spins[0].spin_projection,
         )
-        out_spin2 = _Spin(
+        out_spin2 = _make_spin(
             outgoing_spins[1].spin_magnitude,
             -outgoing_spins[1].spin_projection,
         )
@@ -755,14 +830,16 @@ def clebsch_gordan_helicity_to_canonical(
         if helicity_diff != interaction_qns.s_projection:
             return False
 
-        ang_mom = _Spin(interaction_qns.l_magnitude, interaction_qns.l_projection)
-        coupled_spin = _Spin(interaction_qns.s_magnitude, interaction_qns.s_projection)
+        ang_mom = _make_spin(interaction_qns.l_magnitude, interaction_qns.l_projection)
+        coupled_spin = _make_spin(
+            interaction_qns.s_magnitude, interaction_qns.s_projection
+        )
         parent_spin = ingoing_spins[0].spin_magnitude
 
-        coupled_spin = _Spin(coupled_spin.magnitude, helicity_diff)
+        coupled_spin = _make_spin(coupled_spin.magnitude, helicity_diff)
         if not _check_spin_valid(coupled_spin.magnitude, coupled_spin.projection):
             return False
-        in_spin = _Spin(parent_spin, helicity_diff)
+        in_spin = _make_spin(parent_spin, helicity_diff)
         if not _check_spin_valid(in_spin.magnitude, in_spin.projection):
             return False
 
@@ -788,26 +865,28 @@ def helicity_conservation(
     return False
 
 
+def _none_to_zero(value: Optional[float]) -> float:
+    return 0 if value is None else value
+
+
 @frozen
 class GellMannNishijimaInput:
     charge: EdgeQN.charge = field(converter=EdgeQN.charge)
     isospin_projection: Optional[EdgeQN.isospin_projection] = field(
         converter=optional(EdgeQN.isospin_projection), default=None
     )
+    # The hypercharge fields stay Optional, because argument_handling reads that as
+    # "not required by the rule". The converter replaces a missing value with zero.
     strangeness: Optional[EdgeQN.strangeness] = field(
-        converter=optional(EdgeQN.strangeness), default=None
-    )
-    charmness: Optional[EdgeQN.charmness] = field(
-        converter=optional(EdgeQN.charmness), default=None
+        converter=_none_to_zero, default=None
     )
+    charmness: Optional[EdgeQN.charmness] = field(converter=_none_to_zero, default=None)
     bottomness: Optional[EdgeQN.bottomness] = field(
-        converter=optional(EdgeQN.bottomness), default=None
-    )
-    topness: Optional[EdgeQN.topness] = field(
-        converter=optional(EdgeQN.topness), default=None
+        converter=_none_to_zero, default=None
     )
+    topness: Optional[EdgeQN.topness] = field(converter=_none_to_zero, default=None)
     baryon_number: Optional[EdgeQN.baryon_number] = field(
-        converter=optional(EdgeQN.baryon_number), default=None
+        converter=_none_to_zero, default=None
     )
     electron_lepton_number: Optional[EdgeQN.electron_lepton_number] = field(
         converter=optional(EdgeQN.electron_lepton_number), default=None
@@ -838,43 +917,37 @@ def gellmann_nishijima(edge_qns: GellMannNishijimaInput) -> bool:
     :math:`B'` is `~.Particle.bottomness`, and
     :math:`T` is `~.Particle.topness`.
     """
-
-    def calculate_hypercharge(
-        particle: GellMannNishijimaInput,
-    ) -> float:
-        """Calculate the hypercharge :math:`Y=S+C+B+T+B`."""
-        return sum(
-            0.0 if x is None else x
-            for x in [
-                particle.strangeness,
-                particle.charmness,
-                particle.bottomness,
-                particle.topness,
-                particle.baryon_number,
-            ]
-        )
-
     if (
         edge_qns.electron_lepton_number
         or edge_qns.muon_lepton_number
         or edge_qns.tau_lepton_number
     ):
         return True
-    isospin_3 = 0.0
-    if edge_qns.isospin_projection:
-        isospin_3 = edge_qns.isospin_projection
-    return float(edge_qns.charge) == isospin_3 + 0.5 * calculate_hypercharge(edge_qns)
+    isospin_3 = edge_qns.isospin_projection or 0
+    hypercharge = (
+        cast("float", edge_qns.strangeness)
+        + cast("float", edge_qns.charmness)
+        + cast("float", edge_qns.bottomness)
+        + cast("float", edge_qns.topness)
+        + cast("float", edge_qns.baryon_number)
+    )
+    # compare 2Q = 2I_3 + Y, which is exact since I_3 is a multiple of 1/2
+    return 2 * edge_qns.charge == 2 * isospin_3 + hypercharge
 
 
 @frozen
 class MassEdgeInput:
     mass: EdgeQN.mass = field(converter=EdgeQN.mass)
-    width: Optional[EdgeQN.width] = field(converter=EdgeQN.width, default=None)
+    # Optional marks the width as not required by the rule, see argument_handling.
+    # The converter replaces a missing width with zero.
+    width: Optional[EdgeQN.width] = field(converter=_none_to_zero, default=None)
 
 
 class MassConservation:
     """Mass conservation rule."""
 
+    __slots__ = ("__width_factor",)
+
     def __init__(self, width_factor: float):
         self.__width_factor = width_factor
 
@@ -891,10 +964,14 @@ class MassConservation:
         the net mass of the ingoing state :math:`M_{in}`. Also the width :math:`W` of
         the states is taken into account.
         """
-        mass_in = sum(x.mass for x in ingoing_edge_qns)
-        width_in = sum(x.width for x in ingoing_edge_qns if x.width)
-        mass_out = sum(x.mass for x in outgoing_edge_qns)
-        width_out = sum(x.width for x in outgoing_edge_qns if x.width)
+        mass_in = width_in = 0.0
+        for edge_qns in ingoing_edge_qns:
+            mass_in += edge_qns.mass
+            width_in += cast("float", edge_qns.width)
+        mass_out = width_out = 0.0
+        for edge_qns in outgoing_edge_qns:
+            mass_out += edge_qns.mass
+            width_out += cast("float", edge_qns.width)
 
         return (mass_out - self.__width_factor * width_out) < (
             mass_in + self.__width_factor * width_in
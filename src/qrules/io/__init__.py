@@ -18,6 +18,11 @@ from qrules.io import _dict, _dot
 from qrules.particle import Particle, ParticleCollection
 from qrules.topology import Topology
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 def asdict(instance: object) -> dict:
     if isinstance(instance, ParticleCollection):
@@ -126,7 +131,7 @@ def load(filename: str | Path) -> object:
             definition = json.load(stream)
             return fromdict(definition)
         if file_extension in {"yaml", "yml"}:
-            definition = yaml.load(stream, Loader=yaml.SafeLoader)
+            definition = yaml.load(stream, Loader=_SafeLoader)
             return fromdict(definition)
     msg = f'No loader defined for file type "{file_extension}"'
     raise NotImplementedError(msg)
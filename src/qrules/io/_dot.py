@@ -6,12 +6,12 @@ See :doc:`/usage/visualize` for more info.
 from __future__ import annotations
 
 import logging
-import re
 import string
 from collections import abc
 from functools import singledispatch
 from inspect import isfunction
 from numbers import Number
+from operator import attrgetter, itemgetter
 from typing import TYPE_CHECKING, Any, Iterable, cast
 
 import attrs
@@ -73,10 +73,7 @@ class GraphPrinter:
         lines = self._create_preface()
         lines += self._render(obj)
         indented_lines = [self.indent * " " + s for s in lines]
-        dot = "digraph {\n"
-        dot += "\n".join(indented_lines)
-        dot += "\n}\n"
-        return dot
+        return "digraph {\n" + "\n".join(indented_lines) + "\n}\n"
 
     def _create_preface(self) -> list[str]:
         return [
@@ -358,24 +355,22 @@ def _(obj: InteractionProperties) -> str:
 @as_string.register(EdgeSettings)
 @as_string.register(NodeSettings)
 def _(settings: EdgeSettings | NodeSettings) -> str:
-    output = ""
+    sections = []
     if settings.rule_priorities:
-        output += "RULES\n"
-        rule_descriptions = (
-            f"{__render_rule(rule)} - {__get_priority(rule, settings.rule_priorities)}"
+        prioritized_rules = (
+            (__render_rule(rule), str(__get_priority(rule, settings.rule_priorities)))
             for rule in settings.conservation_rules
         )
-        sorted_names = sorted(rule_descriptions, key=__extract_priority, reverse=True)
-        output += "\n".join(sorted_names)
+        sorted_rules = sorted(prioritized_rules, key=itemgetter(1), reverse=True)
+        sections.append(
+            "RULES\n" + "\n".join(f"{name} - {prio}" for name, prio in sorted_rules)
+        )
     if settings.qn_domains:
-        if output:
-            output += "\n"
         domains = sorted(
             f"{qn.__name__} ∊ {domain}" for qn, domain in settings.qn_domains.items()
         )
-        output += "DOMAINS\n"
-        output += "\n".join(domains)
-    return output
+        sections.append("DOMAINS\n" + "\n".join(domains))
+    return "\n".join(sections)
 
 
 def __get_priority(rule: Any, rule_priorities: dict[Any, int]) -> int | str:
@@ -393,14 +388,6 @@ def __get_type(rule: Rule) -> type[Rule]:
     return type(rule)
 
 
-def __extract_priority(description: str) -> str:
-    matches = re.match(r".* \- ([0-9]+|NA)$", description)
-    if matches is None:
-        msg = f"{description} does not contain a priority number"
-        raise ValueError(msg)
-    return matches[1]
-
-
 @as_string.register(Particle)
 def _(particle: Particle) -> str:
     return particle.name
@@ -513,7 +500,7 @@ def _collapse_graphs(
             FrozenTransition(
                 topology,
                 states={
-                    i: tuple(sorted(particles, key=lambda p: p.name))
+                    i: tuple(sorted(particles, key=attrgetter("name")))
                     for i, particles in group.states.items()
                 },
                 interactions=group.interactions,
@@ -15,8 +15,9 @@ import logging
 import re
 from collections import abc
 from difflib import get_close_matches
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from math import copysign
+from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -230,6 +231,7 @@ class Particle:
             p.text(")")
 
 
+@lru_cache(maxsize=None)
 def _get_name_root(name: str) -> str:
     """Strip a string (particularly the `.Particle.name`) of specifications."""
     name_root = name
@@ -247,6 +249,7 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
     def __init__(self, particles: Iterable[Particle] | None = None) -> None:
         self.__particles: dict[str, Particle] = {}
         self.__pid_to_name: dict[int, str] = {}
+        self.__particle_set: set[Particle] = set()
         if particles is not None:
             self.update(particles)
 
@@ -254,7 +257,7 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
         if isinstance(instance, str):
             return instance in self.__particles
         if isinstance(instance, Particle):
-            return instance in self.__particles.values()
+            return instance in self.__particle_set
         if isinstance(instance, int):
             return instance in self.__pid_to_name
         msg = f"Cannot search for type {type(instance).__name__}"
@@ -272,7 +275,7 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
         error_message = f"No particle with name '{particle_name}' in the database"
         candidates = [
             p.name
-            for p in sorted(self, key=lambda p: p.mass)
+            for p in sorted(self, key=attrgetter("mass"))
             if p.name.startswith(particle_name)
         ]
         if not candidates:
@@ -300,11 +303,8 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
         return self
 
     def __repr__(self) -> str:
-        output = f"{type(self).__name__}({{"
-        for particle in self:
-            output += f"\n    {particle},"
-        output += "})"
-        return output
+        particles = "".join(f"\n    {particle}," for particle in self)
+        return f"{type(self).__name__}({{{particles}}})"
 
     def _repr_pretty_(self, p: PrettyPrinter, cycle: bool) -> None:
         class_name = type(self).__name__
@@ -320,7 +320,7 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
             p.text("})")
 
     def add(self, value: Particle) -> None:
-        if value in self.__particles.values():
+        if value in self.__particle_set:
             equivalent_particles = {p for p in self if p == value}
             equivalent_particle = next(iter(equivalent_particles))
             msg = (
@@ -332,6 +332,7 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
             )
         if value.name in self.__particles:
             _LOGGER.warning(f'Overwriting particle with name "{value.name}"')
+            self.__particle_set.discard(self.__particles[value.name])
         if value.pid in self.__pid_to_name:
             _LOGGER.warning(
                 f"Particle with PID {value.pid} already exists:"
@@ -339,6 +340,7 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
             )
         self.__particles[value.name] = value
         self.__pid_to_name[value.pid] = value.name
+        self.__particle_set.add(value)
 
     def discard(self, value: Particle | str) -> None:
         particle_name = ""
@@ -349,8 +351,10 @@ class ParticleCollection(abc.MutableSet):  # noqa: PLW1641
         else:
             msg = f"Cannot discard something of type {type(value).__name__}"
             raise NotImplementedError(msg)
-        del self.__pid_to_name[self[particle_name].pid]
+        particle = self[particle_name]
+        del self.__pid_to_name[particle.pid]
         del self.__particles[particle_name]
+        self.__particle_set.discard(particle)
 
     def find(self, search_term: int | str) -> Particle:
         """Search for a particle by either name (`str`) or PID (`int`)."""
@@ -499,8 +503,15 @@ def load_pdg() -> ParticleCollection:
     """Create a `.ParticleCollection` with all entries from the PDG.
 
     PDG info is imported from the `scikit-hep/particle
-    <https://github.com/scikit-hep/particle>`_ package.
+    <https://github.com/scikit-hep/particle>`_ package. The PDG entries are converted
+    only once, but each call returns a new `.ParticleCollection` that can be modified
+    safely.
     """
+    return ParticleCollection(__load_pdg_particles())
+
+
+@lru_cache(maxsize=None)
+def __load_pdg_particles() -> tuple[Particle, ...]:
     from particle import Particle as PdgDatabase  # noqa: PLC0415
 
     all_pdg_particles = PdgDatabase.findall(
@@ -511,11 +522,9 @@ def load_pdg() -> ParticleCollection:
         and item.name not in __skip_particles
         and not (item.mass is None and not item.name.startswith("nu"))
     )
-    particle_collection = ParticleCollection()
-    for pdg_particle in all_pdg_particles:
-        new_particle = __convert_pdg_instance(pdg_particle)
-        particle_collection.add(new_particle)
-    return particle_collection
+    return tuple(
+        __convert_pdg_instance(pdg_particle) for pdg_particle in all_pdg_particles
+    )
 
 
 __skip_particles = {
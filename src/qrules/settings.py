@@ -10,10 +10,11 @@ It is possible to change some settings from the outside, for instance:
 from __future__ import annotations
 
 import multiprocessing
-from copy import deepcopy
+import os
 from enum import Enum, auto
+from functools import lru_cache
 from os.path import dirname, join, realpath
-from typing import TYPE_CHECKING, Any, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
 from qrules.conservation_rules import (
     BaryonNumberConservation,
@@ -45,11 +46,10 @@ from qrules.conservation_rules import (
 )
 from qrules.quantum_numbers import EdgeQuantumNumbers as EdgeQN
 from qrules.quantum_numbers import NodeQuantumNumbers as NodeQN
-from qrules.quantum_numbers import arange
-from qrules.solving import EdgeSettings, NodeSettings
+from qrules.solving import EdgeSettings, NodeSettings, _copy_settings
 
 if TYPE_CHECKING:
-    from qrules.particle import Particle, ParticleCollection
+    from qrules.particle import ParticleCollection
     from qrules.transition import SpinFormalism
 
 __QRULES_PATH = dirname(realpath(__file__))
@@ -118,6 +118,17 @@ DEFAULT_INTERACTION_TYPES = [
 ]
 
 
+# The additive rules are stateless, so their instances can be shared
+_CHARGE_CONSERVATION = ChargeConservation()  # type: ignore[abstract]
+_ELECTRON_LN_CONSERVATION = ElectronLNConservation()  # type: ignore[abstract]
+_MUON_LN_CONSERVATION = MuonLNConservation()  # type: ignore[abstract]
+_TAU_LN_CONSERVATION = TauLNConservation()  # type: ignore[abstract]
+_BARYON_NUMBER_CONSERVATION = BaryonNumberConservation()  # type: ignore[abstract]
+_CHARM_CONSERVATION = CharmConservation()  # type: ignore[abstract]
+_STRANGENESS_CONSERVATION = StrangenessConservation()  # type: ignore[abstract]
+_BOTTOMNESS_CONSERVATION = BottomnessConservation()  # type: ignore[abstract]
+
+
 def create_interaction_settings(  # noqa: PLR0917
     formalism: SpinFormalism,
     particle_db: ParticleCollection,
@@ -179,28 +190,28 @@ def create_interaction_settings(  # noqa: PLR0917
         )
 
     interaction_type_settings = {}
-    weak_node_settings = deepcopy(formalism_node_settings)
+    weak_node_settings = _copy_settings(formalism_node_settings)
     weak_node_settings.conservation_rules.update([
-        ChargeConservation(),  # type: ignore[abstract]
-        ElectronLNConservation(),  # type: ignore[abstract]
-        MuonLNConservation(),  # type: ignore[abstract]
-        TauLNConservation(),  # type: ignore[abstract]
-        BaryonNumberConservation(),  # type: ignore[abstract]
+        _CHARGE_CONSERVATION,
+        _ELECTRON_LN_CONSERVATION,
+        _MUON_LN_CONSERVATION,
+        _TAU_LN_CONSERVATION,
+        _BARYON_NUMBER_CONSERVATION,
         identical_particle_symmetrization,
     ])
     weak_node_settings.interaction_strength = 10 ** (-4)
-    weak_edge_settings = deepcopy(formalism_edge_settings)
+    weak_edge_settings = _copy_settings(formalism_edge_settings)
 
     interaction_type_settings[InteractionType.WEAK] = (
         weak_edge_settings,
         weak_node_settings,
     )
 
-    em_node_settings = deepcopy(weak_node_settings)
+    em_node_settings = _copy_settings(weak_node_settings)
     em_node_settings.conservation_rules.update({
-        CharmConservation(),  # type: ignore[abstract]
-        StrangenessConservation(),  # type: ignore[abstract]
-        BottomnessConservation(),  # type: ignore[abstract]
+        _CHARM_CONSERVATION,
+        _STRANGENESS_CONSERVATION,
+        _BOTTOMNESS_CONSERVATION,
         parity_conservation,
         c_parity_conservation,
     })
@@ -209,20 +220,20 @@ def create_interaction_settings(  # noqa: PLR0917
         em_node_settings.qn_domains.update({NodeQN.parity_prefactor: [-1, 1]})
 
     em_node_settings.interaction_strength = 1
-    em_edge_settings = deepcopy(weak_edge_settings)
+    em_edge_settings = _copy_settings(weak_edge_settings)
     interaction_type_settings[InteractionType.EM] = (
         em_edge_settings,
         em_node_settings,
     )
 
-    strong_node_settings = deepcopy(em_node_settings)
+    strong_node_settings = _copy_settings(em_node_settings)
     strong_node_settings.conservation_rules.update({
         isospin_conservation,
         g_parity_conservation,
     })
 
     strong_node_settings.interaction_strength = 60
-    strong_edge_settings = deepcopy(em_edge_settings)
+    strong_edge_settings = _copy_settings(em_edge_settings)
     interaction_type_settings[InteractionType.STRONG] = (
         strong_edge_settings,
         strong_node_settings,
@@ -253,23 +264,40 @@ def _create_domains(particle_db: ParticleCollection) -> dict[Any, list]:
         EdgeQN.g_parity: [-1, +1, None],
     }
 
-    for edge_qn, getter in {
-        EdgeQN.charge: lambda p: p.charge,
-        EdgeQN.baryon_number: lambda p: p.baryon_number,
-        EdgeQN.strangeness: lambda p: p.strangeness,
-        EdgeQN.charmness: lambda p: p.charmness,
-        EdgeQN.bottomness: lambda p: p.bottomness,
+    values = [
+        (
+            particle.charge,
+            particle.baryon_number,
+            particle.strangeness,
+            particle.charmness,
+            particle.bottomness,
+            particle.spin,
+            0 if particle.isospin is None else particle.isospin.magnitude,
+        )
+        for particle in particle_db
+    ]
+    (
+        max_charge,
+        max_baryon_number,
+        max_strangeness,
+        max_charmness,
+        max_bottomness,
+        max_spin,
+        max_isospin,
+    ) = map(max, zip(*values))
+
+    for edge_qn, max_value in {
+        EdgeQN.charge: max_charge,
+        EdgeQN.baryon_number: max_baryon_number,
+        EdgeQN.strangeness: max_strangeness,
+        EdgeQN.charmness: max_charmness,
+        EdgeQN.bottomness: max_bottomness,
     }.items():
-        domains[edge_qn] = __extend_negative(__positive_int_domain(particle_db, getter))
+        domains[edge_qn] = __extend_negative(_int_domain(0, max_value))
 
-    domains[EdgeQN.spin_magnitude] = __positive_halves_domain(
-        particle_db, lambda p: p.spin
-    )
+    domains[EdgeQN.spin_magnitude] = _halves_domain(0, max_spin)
     domains[EdgeQN.spin_projection] = __extend_negative(domains[EdgeQN.spin_magnitude])
-    domains[EdgeQN.isospin_magnitude] = __positive_halves_domain(
-        particle_db,
-        lambda p: 0 if p.isospin is None else p.isospin.magnitude,
-    )
+    domains[EdgeQN.isospin_magnitude] = _halves_domain(0, max_isospin)
     domains[EdgeQN.isospin_projection] = __extend_negative(
         domains[EdgeQN.isospin_magnitude]
     )
@@ -282,7 +310,7 @@ class NumberOfThreads:
     @classmethod
     def get(cls) -> int:
         if cls.__n_cores is None:
-            return multiprocessing.cpu_count()
+            return _get_available_cores()
         return cls.__n_cores
 
     @classmethod
@@ -297,18 +325,12 @@ class NumberOfThreads:
         cls.__n_cores = n_cores
 
 
-def __positive_halves_domain(
-    particle_db: ParticleCollection, attr_getter: Callable[[Particle], Any]
-) -> list[float]:
-    values = set(map(attr_getter, particle_db))
-    return _halves_domain(0, max(values))
-
-
-def __positive_int_domain(
-    particle_db: ParticleCollection, attr_getter: Callable[[Particle], Any]
-) -> list[int]:
-    values = set(map(attr_getter, particle_db))
-    return _int_domain(0, max(values))
+@lru_cache(maxsize=None)
+def _get_available_cores() -> int:
+    """Get the number of cores that this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
 
 
 def _halves_domain(start: float, stop: float) -> list[float]:
@@ -319,7 +341,8 @@ def _halves_domain(start: float, stop: float) -> list[float]:
         msg = f"Stop value {stop} needs to be multiple of 0.5"
         raise ValueError(msg)
     return [
-        int(v) if v.is_integer() else v for v in arange(start, stop + 0.25, delta=0.5)
+        doubled // 2 if doubled % 2 == 0 else doubled / 2
+        for doubled in range(round(2 * start), round(2 * stop) + 1)
     ]
 
 
@@ -330,4 +353,5 @@ def _int_domain(start: int, stop: int) -> list[int]:
 def __extend_negative(
     magnitudes: Iterable[int | float],
 ) -> list[int | float]:
-    return sorted(list(magnitudes) + [-x for x in magnitudes if x > 0])
+    values = sorted(magnitudes)
+    return [-x for x in reversed(values) if x > 0] + values
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import inspect
 import logging
+import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from copy import copy
@@ -70,6 +71,24 @@ class NodeSettings:
     interaction_strength: float = 1.0
 
 
+_Settings = TypeVar("_Settings", EdgeSettings, NodeSettings)
+
+
+def _copy_settings(settings: _Settings) -> _Settings:
+    """Copy the containers of the settings, but share the rules themselves.
+
+    The rule set, priorities and domain lists of the copy can be modified without
+    affecting the original. The rules and domain values are not copied, so this is much
+    cheaper than a `~copy.deepcopy`.
+    """
+    return attrs.evolve(
+        settings,
+        conservation_rules=set(settings.conservation_rules),
+        rule_priorities=dict(settings.rule_priorities),
+        qn_domains={key: list(values) for key, values in settings.qn_domains.items()},
+    )
+
+
 GraphSettings = MutableTransition[EdgeSettings, NodeSettings]
 """(Mutable) mapping of settings on a `.Topology`."""
 GraphElementProperties = MutableTransition[GraphEdgePropertyMap, GraphNodePropertyMap]
@@ -127,11 +146,7 @@ def _convert_non_executed_rules_to_names(
 
     converted_dict = defaultdict(set)
     for node_id, rule_set in rules.items():
-        rule_name_set = set()
-        for rule_tuple in rule_set:
-            rule_name_set.add(get_name(rule_tuple))
-
-        converted_dict[node_id] = rule_name_set
+        converted_dict[node_id] = {get_name(rule) for rule in rule_set}
 
     return converted_dict
 
@@ -399,7 +414,8 @@ def _create_variable_string(
     element_id: int,
     qn_type: type[EdgeQuantumNumber] | type[NodeQuantumNumber],
 ) -> str:
-    return str(element_id) + "-" + qn_type.__name__
+    # interned, so that the solver looks up the same string object for each variable
+    return sys.intern(f"{element_id}-{qn_type.__name__}")
 
 
 @define
@@ -435,6 +451,10 @@ class CSPSolver(Solver):
         self.__problem = Problem(BacktrackingSolver(True))
         self.__allowed_intermediate_states = tuple(allowed_intermediate_states)
         self.__scoresheet = Scoresheet()
+        self.__required_qns: dict[
+            Rule,
+            tuple[set[type[EdgeQuantumNumber]], set[type[NodeQuantumNumber]]],
+        ] = {}
 
     def find_solutions(self, problem_set: QNProblemSet) -> QNResult:  # noqa: C901
         self.__initialize_constraints(problem_set)
@@ -539,19 +559,12 @@ class CSPSolver(Solver):
         def get_rules_by_priority(
             graph_element_settings: NodeSettings | EdgeSettings,
         ) -> list[Rule]:
-            # first add priorities to the entries
-            priority_list = [
-                (
-                    (x, graph_element_settings.rule_priorities[type(x)])  # type: ignore[index]
-                    if type(x) in graph_element_settings.rule_priorities
-                    else (x, 1)
-                )
-                for x in graph_element_settings.conservation_rules
-            ]
-            # then sort according to priority
-            sorted_list = sorted(priority_list, key=lambda x: x[1], reverse=True)
-            # and strip away the priorities again
-            return [x[0] for x in sorted_list]
+            priorities = graph_element_settings.rule_priorities
+            return sorted(
+                graph_element_settings.conservation_rules,
+                key=lambda rule: priorities.get(type(rule), 1),  # type: ignore[call-overload]
+                reverse=True,
+            )
 
         arg_handler = RuleArgumentHandler()
 
@@ -560,7 +573,7 @@ class CSPSolver(Solver):
             for rule in get_rules_by_priority(edge_settings):
                 variable_mapping = _VariableContainer()
                 # from cons law and graph determine needed var lists
-                edge_qns, node_qns = get_required_qns(rule)
+                edge_qns, node_qns = self.__get_required_qns(rule)
 
                 edge_vars, fixed_edge_vars = self.__create_edge_variables(
                     [edge_id],
@@ -585,14 +598,15 @@ class CSPSolver(Solver):
                     self.__non_executable_edge_rules[edge_id].add(rule)  # type: ignore[arg-type]
 
         for node_id in problem_set.topology.nodes:
+            in_edges = problem_set.topology.get_edge_ids_ingoing_to_node(node_id)
+            out_edges = problem_set.topology.get_edge_ids_outgoing_from_node(node_id)
             for rule in get_rules_by_priority(
                 problem_set.solving_settings.interactions[node_id]
             ):
                 variable_mapping = _VariableContainer()
                 # from cons law and graph determine needed var lists
-                edge_qns, node_qns = get_required_qns(rule)
+                edge_qns, node_qns = self.__get_required_qns(rule)
 
-                in_edges = problem_set.topology.get_edge_ids_ingoing_to_node(node_id)
                 in_edge_vars = self.__create_edge_variables(
                     in_edges, edge_qns, problem_set
                 )
@@ -602,9 +616,6 @@ class CSPSolver(Solver):
                     variable_mapping.ingoing_edge_variables
                 )
 
-                out_edges = problem_set.topology.get_edge_ids_outgoing_from_node(
-                    node_id
-                )
                 out_edge_vars = self.__create_edge_variables(
                     out_edges, edge_qns, problem_set
                 )
@@ -642,6 +653,16 @@ class CSPSolver(Solver):
                 else:
                     self.__non_executable_node_rules[node_id].add(rule)
 
+    def __get_required_qns(
+        self, rule: Rule
+    ) -> tuple[set[type[EdgeQuantumNumber]], set[type[NodeQuantumNumber]]]:
+        """Get the required quantum numbers of a rule, inspecting each rule once."""
+        required_qns = self.__required_qns.get(rule)
+        if required_qns is None:
+            required_qns = get_required_qns(rule)
+            self.__required_qns[rule] = required_qns
+        return required_qns
+
     def __create_node_variables(
         self,
         node_id: int,
@@ -867,8 +888,7 @@ class _GraphElementConstraint(Generic[_QNType], Constraint):
                 Boolean value stating if this constraint is currently broken or not.
         """
         params = [(x, assignments.get(x, _unassigned)) for x in variables]
-        missing = [name for (name, val) in params if val is _unassigned]
-        if missing:
+        if any(val is _unassigned for _, val in params):
             return True
 
         self.__update_variable_lists(params)
@@ -1008,8 +1028,7 @@ class _ConservationRuleConstraintWrapper(
                 Boolean value stating if this constraint is currently broken or not.
         """
         params = [(x, assignments.get(x, _unassigned)) for x in variables]
-        missing = [name for (name, val) in params if val is _unassigned]
-        if missing:
+        if any(val is _unassigned for _, val in params):
             return True
 
         self.__update_variable_lists(params)
@@ -29,23 +29,30 @@ Strength = float
 
 GraphSettingsGroups = Dict[Strength, List[Tuple[MutableTransition, GraphSettings]]]
 
+# Note using attrs.fields does not work here because init=False
+_EDGE_QN_MAPPING: dict[str, type[EdgeQuantumNumber]] = {
+    qn_name: qn_type
+    for qn_name, qn_type in EdgeQuantumNumbers.__dict__.items()
+    if not qn_name.startswith("__")
+}
+_NODE_QN_MAPPING: dict[str, type[NodeQuantumNumber]] = {
+    qn_name: qn_type
+    for qn_name, qn_type in NodeQuantumNumbers.__dict__.items()
+    if not qn_name.startswith("__")
+}
+
 
 def create_edge_properties(
     particle: Particle,
     spin_projection: float | None = None,
 ) -> GraphEdgePropertyMap:
-    edge_qn_mapping: dict[str, type[EdgeQuantumNumber]] = {
-        qn_name: qn_type
-        for qn_name, qn_type in EdgeQuantumNumbers.__dict__.items()
-        if not qn_name.startswith("__")
-    }  # Note using attrs.fields does not work here because init=False
     property_map: GraphEdgePropertyMap = {}
     isospin = None
     for qn_name, value in attrs.asdict(particle, recurse=False).items():
         if isinstance(value, Parity):
             value = value.value
-        if qn_name in edge_qn_mapping:
-            property_map[edge_qn_mapping[qn_name]] = value
+        if qn_name in _EDGE_QN_MAPPING:
+            property_map[_EDGE_QN_MAPPING[qn_name]] = value
         else:
             if "isospin" in qn_name:
                 isospin = value
@@ -61,17 +68,12 @@ def create_edge_properties(
 
 
 def create_node_properties(interactions: InteractionProperties) -> GraphNodePropertyMap:
-    node_qn_mapping: dict[str, type[NodeQuantumNumber]] = {
-        qn_name: qn_type
-        for qn_name, qn_type in NodeQuantumNumbers.__dict__.items()
-        if not qn_name.startswith("__")
-    }  # Note using attrs.fields does not work here because init=False
     property_map: GraphNodePropertyMap = {}
     for qn_name, value in attrs.asdict(interactions).items():
         if value is None:
             continue
-        if qn_name in node_qn_mapping:
-            property_map[node_qn_mapping[qn_name]] = value
+        if qn_name in _NODE_QN_MAPPING:
+            property_map[_NODE_QN_MAPPING[qn_name]] = value
         else:
             msg = (
                 "Missmatch between InteractionProperties and NodeQuantumNumbers."
@@ -205,60 +207,58 @@ def remove_duplicate_solutions(
     _LOGGER.info(f"removing these qns from graphs: {remove_qns_list}")
     _LOGGER.info(f"ignoring qns in graph comparison: {ignore_qns_list}")
 
-    filtered_solutions: list[
-        MutableTransition[ParticleWithSpin, InteractionProperties]
-    ] = []
+    filtered_solutions: dict[
+        tuple, MutableTransition[ParticleWithSpin, InteractionProperties]
+    ] = {}
     remove_counter = 0
     for sol_graph in solutions:
         sol_graph = _remove_qns_from_graph(sol_graph, remove_qns_list)
-        found_graph = _check_equal_ignoring_qns(
-            sol_graph, filtered_solutions, ignore_qns_list
-        )
-        if found_graph is None:
-            filtered_solutions.append(sol_graph)
-        else:
-            # check if found solution also has the prefactors
-            # if not overwrite them
+        key = _create_comparison_key(sol_graph, ignore_qns_list)
+        if key in filtered_solutions:
             remove_counter += 1
+        else:
+            filtered_solutions[key] = sol_graph
 
     _LOGGER.info(f"removed {remove_counter} solutions")
-    return filtered_solutions
+    return list(filtered_solutions.values())
 
 
 def _remove_qns_from_graph(
     graph: MutableTransition[ParticleWithSpin, InteractionProperties],
     qn_list: set[type[NodeQuantumNumber]],
 ) -> MutableTransition[ParticleWithSpin, InteractionProperties]:
-    new_interactions = {}
-    for node_id in graph.topology.nodes:
-        interactions = graph.interactions[node_id]
-        new_interactions[node_id] = attrs.evolve(
-            interactions, **{x.__name__: None for x in qn_list}
-        )
-
+    removed_qns = {x.__name__: None for x in qn_list}
+    new_interactions = {
+        node_id: attrs.evolve(interactions, **removed_qns)
+        for node_id, interactions in graph.interactions.items()
+    }
     return attrs.evolve(graph, interactions=new_interactions)  # type: ignore[arg-type]
 
 
-def _check_equal_ignoring_qns(
-    ref_graph: MutableTransition,
-    solutions: list[MutableTransition],
+def _create_comparison_key(
+    graph: MutableTransition[ParticleWithSpin, InteractionProperties],
     ignored_qn_list: set[type[NodeQuantumNumber]],
-) -> MutableTransition | None:
-    """Define equal operator for graphs, ignoring certain quantum numbers."""
-    if not isinstance(ref_graph, MutableTransition):
+) -> tuple:
+    """Create a hashable key that is equal for graphs that are equal.
+
+    Two graphs result in the same key if they have the same topology and the same
+    states and interactions, ignoring the quantum numbers in :code:`ignored_qn_list`.
+    This allows removing duplicates through a `dict` lookup instead of comparing each
+    graph to all graphs that were found before.
+    """
+    if not isinstance(graph, MutableTransition):
         msg = "Reference graph has to be of type MutableTransition"
         raise TypeError(msg)
-    found_graph = None
-    interaction_comparator = NodePropertyComparator(ignored_qn_list)
-    for graph in solutions:
-        if isinstance(graph, MutableTransition) and graph.compare(
-            ref_graph,
-            state_comparator=lambda e1, e2: e1 == e2,
-            interaction_comparator=interaction_comparator,
-        ):
-            found_graph = graph
-            break
-    return found_graph
+    ignored_qns = {x.__name__: None for x in ignored_qn_list}
+    topology = graph.topology
+    return (
+        topology,
+        tuple(graph.states[i] for i in sorted(topology.edges)),
+        tuple(
+            attrs.evolve(graph.interactions[i], **ignored_qns)
+            for i in sorted(topology.nodes)
+        ),
+    )
 
 
 class NodePropertyComparator:
@@ -21,7 +21,7 @@ import itertools
 import logging
 import sys
 from abc import ABC, abstractmethod
-from collections import abc
+from collections import abc, deque
 from functools import total_ordering
 from typing import (
     TYPE_CHECKING,
@@ -245,6 +245,12 @@ class Topology:
     """
     intermediate_edge_ids: frozenset[int] = field(init=False, repr=False)
     """Edge IDs of edges that connect two `nodes`."""
+    _ingoing_edge_ids: FrozenDict[int, frozenset[int]] = field(
+        init=False, repr=False, eq=False
+    )
+    _outgoing_edge_ids: FrozenDict[int, frozenset[int]] = field(
+        init=False, repr=False, eq=False
+    )
 
     def __attrs_post_init__(self) -> None:
         self.__verify()
@@ -265,6 +271,23 @@ class Topology:
         object.__setattr__(self, "incoming_edge_ids", frozenset(incoming))
         object.__setattr__(self, "outgoing_edge_ids", frozenset(outgoing))
         object.__setattr__(self, "intermediate_edge_ids", frozenset(intermediate))
+        node_ingoing: dict[int, set[int]] = {node_id: set() for node_id in self.nodes}
+        node_outgoing: dict[int, set[int]] = {node_id: set() for node_id in self.nodes}
+        for edge_id, edge in self.edges.items():
+            if edge.ending_node_id is not None:
+                node_ingoing[edge.ending_node_id].add(edge_id)
+            if edge.originating_node_id is not None:
+                node_outgoing[edge.originating_node_id].add(edge_id)
+        object.__setattr__(
+            self,
+            "_ingoing_edge_ids",
+            FrozenDict({k: frozenset(v) for k, v in node_ingoing.items()}),
+        )
+        object.__setattr__(
+            self,
+            "_outgoing_edge_ids",
+            FrozenDict({k: frozenset(v) for k, v in node_outgoing.items()}),
+        )
 
     def __verify(self) -> None:
         """Verify if there are no dangling edges or nodes."""
@@ -310,53 +333,41 @@ class Topology:
         raise NotImplementedError
 
     def get_edge_ids_ingoing_to_node(self, node_id: int) -> set[int]:
-        return {
-            edge_id
-            for edge_id, edge in self.edges.items()
-            if edge.ending_node_id == node_id
-        }
+        return set(self._ingoing_edge_ids.get(node_id, ()))
 
     def get_edge_ids_outgoing_from_node(self, node_id: int) -> set[int]:
-        return {
-            edge_id
-            for edge_id, edge in self.edges.items()
-            if edge.originating_node_id == node_id
-        }
+        return set(self._outgoing_edge_ids.get(node_id, ()))
 
     def get_originating_final_state_edge_ids(self, node_id: int) -> set[int]:
         fs_edges = self.outgoing_edge_ids
         edge_ids = set()
-        temp_edge_list = self.get_edge_ids_outgoing_from_node(node_id)
-        while temp_edge_list:
-            new_temp_edge_list = set()
-            for edge_id in temp_edge_list:
-                if edge_id in fs_edges:
-                    edge_ids.add(edge_id)
-                else:
-                    new_node_id = self.edges[edge_id].ending_node_id
-                    if new_node_id is not None:
-                        new_temp_edge_list.update(
-                            self.get_edge_ids_outgoing_from_node(new_node_id)
-                        )
-            temp_edge_list = new_temp_edge_list
+        edges_to_visit = deque(self.get_edge_ids_outgoing_from_node(node_id))
+        while edges_to_visit:
+            edge_id = edges_to_visit.popleft()
+            if edge_id in fs_edges:
+                edge_ids.add(edge_id)
+            else:
+                new_node_id = self.edges[edge_id].ending_node_id
+                if new_node_id is not None:
+                    edges_to_visit.extend(
+                        self.get_edge_ids_outgoing_from_node(new_node_id)
+                    )
         return edge_ids
 
     def get_originating_initial_state_edge_ids(self, node_id: int) -> set[int]:
         is_edges = self.incoming_edge_ids
         edge_ids: set[int] = set()
-        temp_edge_list = self.get_edge_ids_ingoing_to_node(node_id)
-        while temp_edge_list:
-            new_temp_edge_list = set()
-            for edge_id in temp_edge_list:
-                if edge_id in is_edges:
-                    edge_ids.add(edge_id)
-                else:
-                    new_node_id = self.edges[edge_id].originating_node_id
-                    if new_node_id is not None:
-                        new_temp_edge_list.update(
-                            self.get_edge_ids_ingoing_to_node(new_node_id)
-                        )
-            temp_edge_list = new_temp_edge_list
+        edges_to_visit = deque(self.get_edge_ids_ingoing_to_node(node_id))
+        while edges_to_visit:
+            edge_id = edges_to_visit.popleft()
+            if edge_id in is_edges:
+                edge_ids.add(edge_id)
+            else:
+                new_node_id = self.edges[edge_id].originating_node_id
+                if new_node_id is not None:
+                    edges_to_visit.extend(
+                        self.get_edge_ids_ingoing_to_node(new_node_id)
+                    )
         return edge_ids
 
     def relabel_edges(self, old_to_new: Mapping[int, int]) -> Topology:
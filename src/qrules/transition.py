@@ -7,9 +7,10 @@ import re
 import sys
 import warnings
 from collections import defaultdict
-from copy import copy, deepcopy
+from copy import copy
 from enum import Enum, auto
 from multiprocessing import Pool
+from operator import attrgetter
 from typing import Iterable, Sequence, overload
 
 import attrs
@@ -54,6 +55,7 @@ from qrules.solving import (
     NodeSettings,
     QNProblemSet,
     QNResult,
+    _copy_settings,
 )
 from qrules.system_control import (
     GammaCheck,
@@ -346,7 +348,7 @@ class StateTransitionManager:
             selected_particles.update(matches)
         self.__allowed_intermediate_states = [
             create_edge_properties(x)
-            for x in sorted(selected_particles, key=lambda p: p.name)
+            for x in sorted(selected_particles, key=attrgetter("name"))
         ]
         self.__intermediate_particle_filters = selected_particles.names
 
@@ -402,6 +404,7 @@ class StateTransitionManager:
             self.__allowed_interaction_types[node_id] = allowed_interaction_types
 
     def create_problem_sets(self) -> dict[float, list[ProblemSet]]:
+        intermediate_edge_domains = self.__create_intermediate_edge_qn_domains()
         problem_sets = [
             ProblemSet(permutation, initial_facts, settings)
             for topology in self.topologies
@@ -414,41 +417,43 @@ class StateTransitionManager:
             for initial_facts in create_initial_facts(
                 permutation, self.initial_state, self.final_state, self.__particles
             )
-            for settings in self.__determine_graph_settings(permutation, initial_facts)
+            for settings in self.__determine_graph_settings(
+                permutation, initial_facts, intermediate_edge_domains
+            )
         ]
         return _group_by_strength(problem_sets)
 
-    def __determine_graph_settings(  # noqa: C901, PLR0914
-        self, topology: Topology, initial_facts: InitialFacts
+    def __create_intermediate_edge_qn_domains(self) -> dict:
+        weak_edge_settings, _ = self.interaction_type_settings[InteractionType.WEAK]
+        if self.__intermediate_particle_filters is None:
+            return weak_edge_settings.qn_domains
+
+        # if a list of intermediate states is given by user,
+        # built a domain based on these states
+        intermediate_edge_domains: dict[type[EdgeQuantumNumber], set] = defaultdict(set)
+        intermediate_edge_domains[EdgeQuantumNumbers.spin_projection].update(
+            weak_edge_settings.qn_domains[EdgeQuantumNumbers.spin_projection]
+        )
+        for particle_props in self.__allowed_intermediate_states:
+            for edge_qn, qn_value in particle_props.items():
+                if edge_qn in {
+                    EdgeQuantumNumbers.pid,
+                    EdgeQuantumNumbers.mass,
+                    EdgeQuantumNumbers.width,
+                }:
+                    continue
+                intermediate_edge_domains[edge_qn].add(qn_value)
+
+        return {k: list(v) for k, v in intermediate_edge_domains.items()}
+
+    def __determine_graph_settings(  # noqa: PLR0914
+        self,
+        topology: Topology,
+        initial_facts: InitialFacts,
+        int_edge_domains: dict,
     ) -> list[GraphSettings]:
         weak_edge_settings, _ = self.interaction_type_settings[InteractionType.WEAK]
-
-        def create_intermediate_edge_qn_domains() -> dict:
-            if self.__intermediate_particle_filters is None:
-                return weak_edge_settings.qn_domains
-
-            # if a list of intermediate states is given by user,
-            # built a domain based on these states
-            intermediate_edge_domains: dict[type[EdgeQuantumNumber], set] = defaultdict(
-                set
-            )
-            intermediate_edge_domains[EdgeQuantumNumbers.spin_projection].update(
-                weak_edge_settings.qn_domains[EdgeQuantumNumbers.spin_projection]
-            )
-            for particle_props in self.__allowed_intermediate_states:
-                for edge_qn, qn_value in particle_props.items():
-                    if edge_qn in {
-                        EdgeQuantumNumbers.pid,
-                        EdgeQuantumNumbers.mass,
-                        EdgeQuantumNumbers.width,
-                    }:
-                        continue
-                    intermediate_edge_domains[edge_qn].add(qn_value)
-
-            return {k: list(v) for k, v in intermediate_edge_domains.items()}
-
         intermediate_state_edges = topology.intermediate_edge_ids
-        int_edge_domains = create_intermediate_edge_qn_domains()
 
         def create_edge_settings(edge_id: int) -> EdgeSettings:
             settings = copy(weak_edge_settings)
@@ -510,8 +515,18 @@ class StateTransitionManager:
             graph_settings = []
             for temp_setting in temp_graph_settings:
                 for int_type in interaction_types:
-                    updated_setting = deepcopy(temp_setting)
-                    updated_setting.interactions[node_id] = deepcopy(
+                    updated_setting = MutableTransition(
+                        topology,
+                        states={
+                            i: _copy_settings(settings)
+                            for i, settings in temp_setting.states.items()
+                        },
+                        interactions={
+                            i: _copy_settings(settings)
+                            for i, settings in temp_setting.interactions.items()
+                        },
+                    )
+                    updated_setting.interactions[node_id] = _copy_settings(
                         self.interaction_type_settings[int_type][1]
                     )
                     graph_settings.append(updated_setting)
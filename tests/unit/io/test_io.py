@@ -58,3 +58,11 @@ def test_asdict_fromdict_reaction(reaction: ReactionInfo):
 def test_fromdict_exceptions():
     with pytest.raises(NotImplementedError):
         io.fromdict({"non-sense": 1})
+
+
+def test_write_load_json(reaction: ReactionInfo, tmp_path):
+    filename = str(tmp_path / "reaction.json")
+    io.write(reaction, filename)
+    imported_reaction = io.load(filename)
+    assert isinstance(imported_reaction, ReactionInfo)
+    assert imported_reaction == reaction
@@ -204,8 +204,11 @@ class TestParticleCollection:
         assert f"{pi_plus.pid}" in caplog.text
         caplog.clear()
         with caplog.at_level(logging.WARNING):
-            pions.add(create_particle(pi_plus, width=1.0))
+            new_pi_plus = create_particle(pi_plus, width=1.0)
+            pions.add(new_pi_plus)
         assert "pi+" in caplog.text
+        assert new_pi_plus in pions
+        assert pi_plus not in pions
 
     @pytest.mark.parametrize("name", ["gamma", "pi0", "K+"])
     def test_contains(self, name: str, particle_database: ParticleCollection):
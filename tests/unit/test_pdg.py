@@ -56,3 +56,15 @@ def test_missing_in_pdg(
     assert {p.name for p in missing_in_pdg} == {
         "Y(4260)",
     }
+
+
+def test_load_pdg_returns_new_collection(pdg: ParticleCollection):
+    collection = load_pdg()
+    assert collection is not pdg
+    assert collection == pdg
+    collection.discard("pi0")
+    assert "pi0" not in collection
+    assert "pi0" in pdg
+    new_collection = load_pdg()
+    assert "pi0" in new_collection
+    assert new_collection == pdg
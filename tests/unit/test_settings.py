@@ -2,6 +2,7 @@ import pytest
 
 from qrules.particle import ParticleCollection
 from qrules.quantum_numbers import EdgeQuantumNumbers as EdgeQN
+from qrules.quantum_numbers import NodeQuantumNumbers as NodeQN
 from qrules.settings import (
     InteractionType,
     _create_domains,
@@ -116,6 +117,19 @@ def test_create_interaction_settings(
     assert node_qn_domains_str == expected
 
 
+def test_create_interaction_settings_domains_are_independent(
+    particle_database: ParticleCollection,
+):
+    settings = create_interaction_settings("helicity", particle_db=particle_database)
+    strong_edge_settings, strong_node_settings = settings[InteractionType.STRONG]
+    strong_edge_settings.qn_domains[EdgeQN.spin_magnitude].remove(2)
+    strong_node_settings.qn_domains[NodeQN.l_magnitude].remove(2)
+    for interaction_type in [InteractionType.EM, InteractionType.WEAK]:
+        edge_settings, node_settings = settings[interaction_type]
+        assert 2 in edge_settings.qn_domains[EdgeQN.spin_magnitude]
+        assert 2 in node_settings.qn_domains[NodeQN.l_magnitude]
+
+
 @pytest.mark.parametrize(
     ("start", "stop", "expected"),
     [
@@ -199,6 +199,12 @@ class TestTopology:
         assert topology.incoming_edge_ids == {-2, -1}
         assert topology.outgoing_edge_ids == {0, 1, 2}
         assert topology.intermediate_edge_ids == {3, 4}
+        assert topology.get_edge_ids_ingoing_to_node(0) == {-2, -1}
+        assert topology.get_edge_ids_ingoing_to_node(1) == {3}
+        assert topology.get_edge_ids_outgoing_from_node(1) == {0, 4}
+        assert topology.get_edge_ids_outgoing_from_node(2) == {1, 2}
+        assert topology.get_originating_final_state_edge_ids(1) == {0, 1, 2}
+        assert topology.get_originating_initial_state_edge_ids(2) == {-2, -1}
         assert get_originating_node_list(topology, edge_ids=[-1]) == []
         assert get_originating_node_list(topology, edge_ids=[1, 2]) == [2, 2]
 